@@ -118,8 +118,7 @@ def get_stats(stat_name, cores, results_dirs, base=None):
     df.gmean()
 
   if args.export_stat_csv:
-    with open(args.export_stat_csv, 'w') as csvof:
-      csvof.write(df.df.to_csv())
+    df.df.to_csv(args.export_stat_csv)
   else:
     df.print()
 
@@ -46,6 +46,10 @@ keywords = ["Notify:", "Warning:", "Heartbeat:", "Finished:"]
 failwords = ["Error:", "ASSERT"]
 search_files = ["*.stdout", "*.stderr"]
 
+heartbeat_pattern = re.compile(r"Heartbeat:\s+([0-9]+)\%.*--(.*)$")
+finished_pattern = re.compile(r"Finished:\s+insts:([0-9]+)\s+cycles:([0-9]+)")
+inst_limit_pattern = re.compile(r"--inst_limit\s+([0-9]+)")
+
 class Progress:
   """
   Tracks progress of Scarab Jobs.
@@ -59,6 +63,8 @@ class Progress:
     self.search_files = search_files + _search_files
     self.failwords = failwords + _failwords
     self.keywords = keywords + _keywords + self.failwords
+    # Every line of every search file is tested against every keyword, so compile them up front.
+    self.keyword_patterns = [(keyword, re.compile(keyword)) for keyword in self.keywords]
     self.status = JobStatus.HAS_NOT_STARTED
     self.progress = 0.0 # % completed, only valid if status is Running
     self.message = ""
@@ -96,8 +102,8 @@ class Progress:
 
   def _parse_file_for_keywords(self, fp):
     for line in fp:
-      for keyword in self.keywords:
-        m = re.search(keyword, line)
+      for keyword, pattern in self.keyword_patterns:
+        m = pattern.search(line)
         if m:
           self.matching_lines[keyword].append(line.rstrip())
 
@@ -136,7 +142,7 @@ class Progress:
         self.message = "No Heartbeat found. Scarab is probably running..."
       else:
         last_heartbeat_line = self.matching_lines["Heartbeat:"][-1]
-        m = re.search("Heartbeat:\s+([0-9]+)\%.*--(.*)$", last_heartbeat_line)
+        m = heartbeat_pattern.search(last_heartbeat_line)
         self.progress = int(m.group(1))
         self.message = generate_progress_bar(self.progress, 100, m.group(2))
       self.status = JobStatus.RUNNING
@@ -151,7 +157,7 @@ class Progress:
     self.inst_limit = 0
     with open(self.params_out) as f:
       for line in f:
-        m = re.search("^--inst_limit\s+([0-9]+)", line)
+        m = inst_limit_pattern.match(line)
         if m:
           self.inst_limit = int(m.group(1))
           break
@@ -175,7 +181,7 @@ class Progress:
         return True
 
     for line in self.matching_lines["Finished:"]:
-      m = re.search("Finished:\s+insts:([0-9]+)\s+cycles:([0-9]+)", line)
+      m = finished_pattern.search(line)
       inst_count = int(m.group(1))
       cycle_count = int(m.group(2))
       self._get_inst_limit()
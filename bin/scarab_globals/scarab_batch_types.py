@@ -142,8 +142,8 @@ class ScarabRun:
     progress.sort()
     print("JOB: {name}".format(name=self.job_name))
     print('-'*70)
-    for p in progress:
-      print(p)
+    if progress:
+      print("\n".join(str(p) for p in progress))
     print('='*70+"\n")
 
   def get_stats(self, flat=False):
@@ -59,6 +59,11 @@ pd.set_option('display.float_format', "{:,.2f}".format)
 
 print_warnings = True
 
+# Compiled once at import; these are applied to every stat file and every stat line.
+stat_file_pattern = re.compile(r'[.]stat[.]([0-9]+)[.]out')
+# A slow regex that grabs all stat values from file:
+stat_line_pattern = re.compile(r'^([^\s]+)\s+([0-9.]+)\s+([0-9.nan-]+)?[%]?\s+([0-9.]+)\s+([0-9.nan-]+)?[%]?')
+
 #####################################################################
 # Stat Hierarchy
 #####################################################################
@@ -130,7 +135,13 @@ class StatCollection:
     return self
 
   def get(self, stat_name=None, core_id=None):
-    combined_df = pd.DataFrame()
+    # Collect the columns first and build the DataFrame once; inserting
+    # them one at a time re-allocates the frame on every insert.
+    # The index is pinned to the first column, which is what the first
+    # insert into an empty DataFrame used to establish. Later columns are
+    # aligned to it rather than unioned (and re-sorted) with it.
+    combined_columns = {}
+    combined_index = None
     for frame in self.frame_list:
       df = frame.get(stat_name=stat_name, core_id=core_id).df
 
@@ -140,9 +151,11 @@ class StatCollection:
           column,
           core_id
           )
-        combined_df.loc[:, frame_name] = df[column].copy()
+        if combined_index is None:
+          combined_index = df.index
+        combined_columns[frame_name] = df[column]
 
-    return StatDF(combined_df.copy())
+    return StatDF(pd.DataFrame(combined_columns, index=combined_index))
 
   def sort_names_by_stat(self, stat_name, core_id, cutoff=None):
     stat_name_ = stat_name.split('=')[0]
@@ -160,7 +173,9 @@ class StatRun(StatCollection):
     self.frame_list.append(frame)
 
   def get(self, stat_name=None, core_id=None):
-    combined_df = pd.DataFrame()
+    # See StatCollection.get: the cores of the first row define the columns.
+    combined_rows = {}
+    combined_index = None
     for frame in self.frame_list:
       df = frame.get(stat_name=stat_name, core_id=core_id).df
 
@@ -170,9 +185,11 @@ class StatRun(StatCollection):
           index,
           stat_name
           )
-        combined_df.loc[:, frame_name] = row.copy()
+        if combined_index is None:
+          combined_index = row.index
+        combined_rows[frame_name] = row
 
-    return StatDF(combined_df.T.copy())
+    return StatDF(pd.DataFrame(combined_rows, index=combined_index).T)
   
   @staticmethod
   def _generate_name(frame_name, stat, stat_list):
@@ -415,7 +432,7 @@ class StatFileParser:
 
     # Get core id from stat filename and parse all stats
     for stats_file in stats_file_list:
-      m = re.search('[.]stat[.]([0-9]+)[.]out', stats_file)
+      m = stat_file_pattern.search(stats_file)
       if m:
         stats_file_name = os.path.join(self.results_dir, stats_file)
         core_id = int(m.group(1))
@@ -434,25 +451,27 @@ class StatFileParser:
     try:
       with open(statsfile) as fp:
         for line in fp:
-          if self._is_stat_line(line):
-            stat, value = self._parse_stat(line)
+          m = self._is_stat_line(line)
+          if m:
+            stat, value = self._parse_stat(m)
             self._add_stat(core_id, stat, value, statsfile)
     except Exception as e:
       if print_warnings:
         warn("Unable to read stats file {} : ".format(statsfile) + str(e))
 
-  def _parse_stat(self, stat_str):
-    """Convert stat string to stat name and float
+  def _parse_stat(self, stat_match):
+    """Convert a matched stat line to stat name and float
 
     Args:
-        stat_str (string): A string from the Scarab statfile that contains a stat. 
-        otherwise return the column not affected by reset stats.
+        stat_match (RegEx Object): The match returned by _is_stat_line for a line
+        that contains a stat. Reusing it avoids running the regex twice per line.
 
     Returns:
         string, float: The string name of the stat, the float value of the stat
     """
-    m = self._is_stat_line(stat_str)
-    return m.group(1), float(m.group(4))
+    # Stat names repeat for every core and every results directory in a batch,
+    # intern them so all StatFrames share one copy of each name.
+    return sys.intern(stat_match.group(1)), float(stat_match.group(4))
 
   def _is_stat_line(self, stat_str):
     """The regex pattern that 1) tells you if a line from the statsfile contains a stat and
@@ -469,18 +488,14 @@ class StatFileParser:
     Returns:
         RegEx Object: The Regex Object containing the parsed results
     """
-    # A slow regex that grabs all stat values from file:
-    pattern_all_values = '^([^\s]+)\s+([0-9.]+)\s+([0-9.nan-]+)?[%]?\s+([0-9.]+)\s+([0-9.nan-]+)?[%]?'
-
-    # If we only need the reset stats, then use the faster regex...
-    m = re.search(pattern_all_values, stat_str)
-    return m
+    return stat_line_pattern.search(stat_str)
 
   def _add_stat(self, core_id, stat, value, statsfile):
-    if not core_id in self.stat_values:
-      self.stat_values[core_id] = {}
+    core_stat_values = self.stat_values.get(core_id)
+    if core_stat_values is None:
+      core_stat_values = self.stat_values[core_id] = {}
 
-    self.stat_values[core_id][stat] = value
+    core_stat_values[stat] = value
 
     if core_id == 0:
       # Only add stat names and files once, always for core 0
@@ -55,18 +55,21 @@ def recursive_copy(src_dir, dest_dir):
   assert_path_exists(src_dir)
   assert_path_exists(dest_dir)
 
-  for child in os.listdir(src_dir):
-    child_filename = os.fsdecode(child)
-    dest_path = dest_dir + "/" + child_filename
-    if not os.path.exists(dest_path):
-      child_path = src_dir + "/" + child_filename
-      if child_path != os.path.commonpath([dest_path, child_path]):
-        if (os.path.isdir(child_path)):
-          #print("RECURSIVE COPY:", child_path, dest_path)
-          shutil.copytree(child_path, dest_path)
-        else:
-          #print("COPY:", child_path, dest_path)
-          shutil.copy2(child_path, dest_path)
+  # scandir hands back the entry type with the listing, so telling
+  # directories from files does not cost an extra stat per child.
+  with os.scandir(src_dir) as children:
+    for child in children:
+      child_filename = os.fsdecode(child.name)
+      dest_path = dest_dir + "/" + child_filename
+      if not os.path.exists(dest_path):
+        child_path = src_dir + "/" + child_filename
+        if child_path != os.path.commonpath([dest_path, child_path]):
+          if child.is_dir():
+            #print("RECURSIVE COPY:", child_path, dest_path)
+            shutil.copytree(child_path, dest_path)
+          else:
+            #print("COPY:", child_path, dest_path)
+            shutil.copy2(child_path, dest_path)
 
 def assert_path_exists(assert_path):
   assert os.path.exists(assert_path), "Error: Path does not exist: {}".format(assert_path)
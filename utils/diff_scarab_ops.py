@@ -24,8 +24,11 @@ class LogReader:
   def __iter__(self):
     with open(self.path) as f:
       for i, line in enumerate(f):
-        if not line.strip().startswith('DEBUG_OP_FIELDS'): continue
-        yield i, line.strip()
+        # Cheap substring test first so the bulk of stdout is never stripped.
+        if 'DEBUG_OP_FIELDS' not in line: continue
+        line = line.strip()
+        if not line.startswith('DEBUG_OP_FIELDS'): continue
+        yield i, line
 
 def main():
   args = parse_args()